@@ -1,7 +1,9 @@
 from datetime import datetime
+from functools import lru_cache
 import os
-import pandas as pd
-from fastapi import FastAPI, HTTPException, File, UploadFile
+import orjson
+import polars as pl
+from fastapi import FastAPI, HTTPException, File, UploadFile, Response
 from fastapi.middleware.cors import CORSMiddleware
 import shutil
 
@@ -24,33 +26,260 @@ app.add_middleware(
 # Data file path (this is where uploaded file will be saved)
 DATA_FILE = os.getenv("DATA_FILE", "extended_patient_outbreak_dataset_5000_diverse.csv")
 
+REQUIRED_COLUMNS = {
+    'Patient_ID', 'Age', 'Sex', 'Outcome', 'State', 'LGA',
+    'Case_Status', 'Last_Update'
+}
+
+# Low-cardinality text columns, held as Polars categoricals in memory and as
+# dictionary-encoded strings in Parquet
+CATEGORICAL_COLUMNS = ['Sex', 'State', 'LGA', 'Outcome', 'Case_Status']
+
+# Pinned CSV types for the columns the summary reads. Inference only samples
+# the first rows, so a later `28.5` age or timestamped Last_Update would fail
+# the parse; Last_Update is read as text and parsed by apply_column_types.
+CSV_SCHEMA_OVERRIDES = {
+    **{name: pl.Categorical for name in CATEGORICAL_COLUMNS},
+    'Age': pl.Float64,
+    'Last_Update': pl.String
+}
+
+# ISO 8601 shapes accepted for text Last_Update values (after the date/time
+# "T" separator is normalized to a space). Tried in order per value, so mixed
+# shapes parse the same regardless of row order or streaming batches.
+LOCAL_DATETIME_FORMATS = ['%Y-%m-%d %H:%M:%S%.f', '%Y-%m-%d %H:%M', '%Y-%m-%d']
+OFFSET_DATETIME_FORMATS = ['%Y-%m-%d %H:%M:%S%.f%#z', '%Y-%m-%d %H:%M%#z']
+
+# Normalized (stripped, lower-cased) Sex values -> dashboard gender label
+GENDER_MAP = {
+    'm': 'Male',
+    'male': 'Male',
+    'male.': 'Male',
+    'f': 'Female',
+    'female': 'Female',
+    'female.': 'Female',
+    'nan': 'Other/Unknown',
+    '': 'Other/Unknown'
+}
+
+# Derived labels are held as Enums: one small integer code per row, with the
+# label strings stored once and only materialized when the summary is emitted
+AGE_GROUP = pl.Enum(["0-14", "15-49", "50+", "Other/Unknown"])
+GENDER = pl.Enum(["Male", "Female", "Other/Unknown"])
+
+# Columns derived for the summary; Parquet files from write_parquet store them
+DERIVED_COLUMNS = [
+    'Year', 'WeekStart', 'AgeGroup', 'Gender',
+    '_is_deceased', '_is_discharged', '_is_confirmed'
+]
+
+# Data files larger than this are streamed through the summary queries
+# instead of being loaded into memory
+STREAMING_THRESHOLD_MB = float(os.getenv("STREAMING_THRESHOLD_MB", "512"))
+
+# Validated dataset, set up once at startup and refreshed on upload or /reload:
+# a lazy view of the in-memory frame, or of the file itself when streaming
+DF_CACHE: pl.LazyFrame | None = None
+DF_STREAMING: bool = False
+# Bumped by every refresh; the summary caches are keyed on it
+DF_GENERATION: int = 0
+
+
+def is_parquet(path: str) -> bool:
+    return path.lower().endswith(".parquet")
+
+
+def apply_column_types(df: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
+    """
+    Cast the low-cardinality text columns to Categorical, Last_Update to
+    Datetime, and (for loaded frames of whole-number ages) Age to the narrowest
+    integer type that holds it.
+    """
+    schema = df.collect_schema()
+
+    # The CSV scan already builds these as Categorical; only convert the rest
+    categorical = [name for name in CATEGORICAL_COLUMNS if schema[name] != pl.Categorical]
+
+    last_update = pl.col('Last_Update')
+    if schema['Last_Update'] == pl.String:
+        # Every accepted shape is tried explicitly; anything else becomes null
+        text = last_update.str.strip_chars().str.replace(r'^(\d{4}-\d{2}-\d{2})T', '$1 ')
+        last_update = pl.coalesce(
+            # Offsets (including "Z") are converted to naive UTC
+            *[text.str.to_datetime(fmt, time_unit='ms', strict=False)
+              .dt.replace_time_zone(None)
+              for fmt in OFFSET_DATETIME_FORMATS],
+            *[text.str.to_datetime(fmt, time_unit='ms', strict=False)
+              for fmt in LOCAL_DATETIME_FORMATS]
+        )
 
-def load_and_validate_data() -> pd.DataFrame:
-    """Load and validate the patient dataset."""
-    if not os.path.exists(DATA_FILE):
-        raise FileNotFoundError(f"Data file not found: {DATA_FILE}")
+    age = pl.col('Age')
+    if isinstance(df, pl.DataFrame):
+        # Picking the type needs the whole column, so only once it is loaded.
+        # Fractional ages stay Float64: a Float32 could move them across the
+        # AgeGroup bin edges (14.0000001 would round down into "0-14")
+        values = df['Age'].drop_nulls()
+        if values.dtype.is_integer() or (
+            values.dtype.is_float()
+            and (values.is_finite() & (values == values.floor())).all()
+        ):
+            age = age.cast(pl.Int64).shrink_dtype()
+
+    return df.with_columns(
+        *[pl.col(name).cast(pl.String).cast(pl.Categorical) for name in categorical],
+        last_update.cast(pl.Datetime('ms')),
+        age
+    )
+
+
+def scan_and_validate_data(path: str = DATA_FILE) -> pl.LazyFrame:
+    """Lazily scan the patient dataset (CSV or Parquet), validating its header."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Data file not found: {path}")
     
     try:
-        df = pd.read_csv(DATA_FILE)
+        if is_parquet(path):
+            lf = pl.scan_parquet(path)
+        else:
+            # Categorical columns are built while parsing, not converted afterwards
+            lf = pl.scan_csv(path, schema_overrides=CSV_SCHEMA_OVERRIDES)
+        columns = lf.collect_schema().names()
     except Exception as e:
-        raise ValueError(f"Error reading CSV file: {str(e)}")
+        kind = "Parquet" if is_parquet(path) else "CSV"
+        raise ValueError(f"Error reading {kind} file: {str(e)}")
     
-    required_columns = {
-        'Patient_ID', 'Age', 'Sex', 'Outcome', 'State', 'LGA',
-        'Case_Status', 'Last_Update'
-    }
-    missing = required_columns - set(df.columns)
+    missing = REQUIRED_COLUMNS - set(columns)
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
-    
-    return df
+
+    return lf
+
+
+def load_and_validate_data(path: str = DATA_FILE) -> pl.DataFrame:
+    """Load and validate the patient dataset (CSV or Parquet)."""
+    lf = scan_and_validate_data(path)
+
+    try:
+        df = lf.collect()
+    except Exception as e:
+        kind = "Parquet" if is_parquet(path) else "CSV"
+        raise ValueError(f"Error reading {kind} file: {str(e)}")
+
+    # Integer-coded categoricals make groupby and equality checks cheap
+    return apply_column_types(df)
+
+
+def write_parquet(df: pl.DataFrame, path: str) -> None:
+    """
+    Write the dataset as Parquet with typed columns (categoricals as
+    dictionary<string>, Last_Update as timestamp[ms]) and the derived
+    summary columns already materialized.
+    The file is written alongside and then moved into place, so readers (and
+    a failed write) never see a partial file at `path`.
+    """
+    temp_path = f"{path}.tmp"
+    try:
+        apply_column_types(df).with_columns(derived_columns()).write_parquet(temp_path)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def derived_columns() -> list[pl.Expr]:
+    """Expressions for DERIVED_COLUMNS, computed from the typed source columns."""
+    # NaN ages would otherwise compare as larger than every bin edge
+    age = pl.col('Age').cast(pl.Float64).fill_nan(None)
+
+    return [
+        # --- Year & ISO week (as the Monday it starts on) ---
+        pl.col('Last_Update').dt.year().cast(pl.Int16).alias('Year'),
+        pl.col('Last_Update').dt.truncate('1w').cast(pl.Date).alias('WeekStart'),
+
+        # --- Age Grouping (right-closed bins; when/then, unlike cut, streams) ---
+        pl.when(age <= 14).then(pl.lit("0-14"))
+        .when(age <= 49).then(pl.lit("15-49"))
+        .when(age > 49).then(pl.lit("50+"))
+        .otherwise(pl.lit("Other/Unknown"))
+        .cast(AGE_GROUP)
+        .alias('AgeGroup'),
+
+        # --- Gender Normalization ---
+        pl.col('Sex')
+        .cast(pl.String)
+        .str.strip_chars()
+        .str.to_lowercase()
+        .replace_strict(GENDER_MAP, default="Other/Unknown", return_dtype=GENDER)
+        .alias('Gender'),
+
+        # --- Indicator columns (summed per group) ---
+        pl.col('Outcome').eq_missing('Deceased').cast(pl.Int8).alias('_is_deceased'),
+        pl.col('Outcome').eq_missing('Discharged').cast(pl.Int8).alias('_is_discharged'),
+        pl.col('Case_Status').eq_missing('Confirmed').cast(pl.Int8).alias('_is_confirmed')
+    ]
+
+
+def prepare_data(df: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
+    """
+    Reduce the dataset to the (derived) columns the summary aggregates over.
+    Derived columns already stored in the file are used as they are.
+    """
+    if set(DERIVED_COLUMNS) <= set(df.collect_schema().names()):
+        # Enums are read back from Parquet as Categoricals
+        derived = [
+            pl.col(DERIVED_COLUMNS).exclude('AgeGroup', 'Gender'),
+            pl.col('AgeGroup').cast(AGE_GROUP),
+            pl.col('Gender').cast(GENDER)
+        ]
+    else:
+        derived = derived_columns()
+
+    return df.select('State', 'LGA', 'Last_Update', *derived)
+
+
+def refresh_data_cache() -> pl.LazyFrame:
+    """Reload and enrich the dataset from disk into the module-level cache."""
+    global DF_CACHE, DF_STREAMING, DF_GENERATION
+
+    # Projection pushdown means only the columns prepare_data needs are read:
+    # the source columns, or just the stored derived ones for prepared Parquet
+    lf = prepare_data(apply_column_types(scan_and_validate_data()))
+
+    # Large files keep only the query plan; each summary run streams the file
+    # through it in batches, so memory is bounded by the batch and the grouped
+    # results rather than the file
+    streaming = os.path.getsize(DATA_FILE) > STREAMING_THRESHOLD_MB * 1024 * 1024
+    if not streaming:
+        try:
+            lf = lf.collect().lazy()
+        except Exception as e:
+            raise ValueError(f"Error reading data file: {str(e)}")
+
+    DF_CACHE = lf
+    DF_STREAMING = streaming
+    # Bumped last: a summary keyed on the new generation always sees the new
+    # frame, and one still running for the old generation can only store its
+    # result under the old key, which is never asked for again
+    DF_GENERATION += 1
+    return lf
+
+
+@app.on_event("startup")
+def load_data_on_startup():
+    """Load the dataset (or plan the streaming scan) once, off the request path."""
+    try:
+        refresh_data_cache()
+    except (FileNotFoundError, ValueError):
+        # Leave the cache empty; /summary retries and reports the error
+        pass
 
 
 @app.get("/")
 def root():
     return {
         "message": "Lassa Fever Dashboard API is live!",
-        "endpoints": ["/summary", "/upload"]
+        "endpoints": ["/summary", "/upload", "/reload"]
     }
 
 
@@ -71,18 +300,19 @@ async def upload_file(file: UploadFile = File(...)):
             shutil.copyfileobj(file.file, buffer)
 
         # Validate the CSV structure
-        df = pd.read_csv(temp_path)
-        required_columns = {
-            'Patient_ID', 'Age', 'Sex', 'Outcome', 'State', 'LGA',
-            'Case_Status', 'Last_Update'
-        }
-        missing = required_columns - set(df.columns)
+        df = pl.read_csv(temp_path, schema_overrides=CSV_SCHEMA_OVERRIDES)
+        missing = REQUIRED_COLUMNS - set(df.columns)
         if missing:
             os.remove(temp_path)
             raise HTTPException(status_code=400, detail=f"Missing required columns: {missing}")
 
-        # If valid, move to permanent location
-        shutil.move(temp_path, DATA_FILE)
+        # If valid, move to permanent location (converting if the store is Parquet)
+        if is_parquet(DATA_FILE):
+            write_parquet(df, DATA_FILE)
+            os.remove(temp_path)
+        else:
+            shutil.move(temp_path, DATA_FILE)
+        refresh_data_cache()
 
         return {
             "message": "File uploaded and validated successfully.",
@@ -91,7 +321,7 @@ async def upload_file(file: UploadFile = File(...)):
             "total_records": len(df)
         }
 
-    except pd.errors.EmptyDataError:
+    except pl.exceptions.NoDataError:
         raise HTTPException(status_code=400, detail="Uploaded file is empty.")
     except Exception as e:
         if os.path.exists("temp_uploaded.csv"):
@@ -99,145 +329,210 @@ async def upload_file(file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail=f"Invalid CSV file: {str(e)}")
 
 
-@app.get("/summary")
-def get_summary():
+@app.post("/reload")
+def reload_data():
     """
-    Returns aggregated outbreak summary in dashboard-ready JSON format.
-    Includes KPIs, demographics, LGA breakdown, and WEEKLY trends.
+    Re-read the data file from disk and precompute the summary.
+    Use after replacing DATA_FILE outside of /upload.
     """
     try:
-        df = load_and_validate_data()
-        df = df.copy()
-
-        # --- Convert Last_Update to datetime and extract Year & ISO Week ---
-        df['Last_Update'] = pd.to_datetime(df['Last_Update'], errors='coerce')
-        df['Year'] = df['Last_Update'].dt.year
-        df['Week'] = df['Last_Update'].dt.isocalendar().week  # ISO week (1-53)
-        df['YearWeek'] = df['Year'].astype(str) + '-W' + df['Week'].astype(str).str.zfill(2)
-
-        # --- Age Grouping ---
-        def get_age_group(age):
-            if pd.isna(age):
-                return "Other/Unknown"
-            if age <= 14:
-                return "0-14"
-            elif age <= 49:
-                return "15-49"
-            else:
-                return "50+"
-        
-        df['AgeGroup'] = df['Age'].apply(get_age_group)
+        refresh_data_cache()
+        generation = DF_GENERATION
+        _compute_summary(generation)
+        # The record count comes out of the same single collect_all pass that
+        # builds the summary, rather than a separate scan of the file
+        total_records = _build_summary(generation)["metadata"]["total_records"]
+    except (FileNotFoundError, ValueError, pl.exceptions.PolarsError) as e:
+        raise HTTPException(status_code=500, detail=f"Reload failed: {str(e)}")
 
-        # --- Gender Normalization ---
-        df['Gender'] = (
-            df['Sex']
-            .astype(str)
-            .str.strip()
-            .str.title()
-            .replace({
-                'M': 'Male',
-                'F': 'Female',
-                'Male.': 'Male',
-                'Female.': 'Female',
-                'nan': 'Other/Unknown'
-            })
-            .fillna("Other/Unknown")
+    return {
+        "message": "Data reloaded successfully.",
+        "data_file": DATA_FILE,
+        "total_records": total_records
+    }
+
+
+def _kpi_query(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """Single-row frame with the headline counts."""
+    # The streaming engine runs group_by but not whole-frame reductions, so
+    # count the (at most eight) indicator combinations there and sum those
+    rows = pl.col('len')
+    confirmed = rows * pl.col('_is_confirmed')
+    return (
+        lf.group_by('_is_confirmed', '_is_deceased', '_is_discharged').len()
+        .select(
+            rows.sum().alias('total_records'),
+            confirmed.sum().alias('confirmed_cases'),
+            (confirmed * pl.col('_is_deceased')).sum().alias('deaths'),
+            (confirmed * pl.col('_is_discharged')).sum().alias('recoveries')
+        )
+    )
+
+
+def _distinct_query(lf: pl.LazyFrame, column: str) -> pl.LazyFrame:
+    """Single-row frame with the number of distinct non-null values of `column`."""
+    # Grouped (on the string values, as categorical keys don't stream) rather
+    # than n_unique, so large files stream
+    return (
+        lf.group_by(pl.col(column).cast(pl.String)).len()
+        .select(pl.col(column).count())
+    )
+
+
+def _breakdown_query(lf: pl.LazyFrame, column: str) -> pl.LazyFrame:
+    """Record counts per category of `column`, most common first."""
+    return lf.group_by(column).len().sort(['len', column], descending=[True, False])
+
+
+def _lga_query(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """LGA breakdown (with Year) in dashboard row shape."""
+    lga_agg = (
+        # String keys, as categorical keys don't stream
+        lf.group_by(pl.col('LGA', 'State').cast(pl.String))
+        .agg(
+            pl.len().alias('cases'),
+            pl.col('_is_deceased').sum().alias('deaths'),
+            pl.col('_is_discharged').sum().alias('recoveries'),
+            pl.col('Last_Update').max().alias('last_update'),
+            pl.col('Year').max().alias('year')
+        )
+        .sort(['LGA', 'State'], nulls_last=True)
+    )
+
+    return lga_agg.select(
+        pl.col('LGA').fill_null("Unknown").alias('lga'),
+        pl.col('State').fill_null("Unknown").alias('state'),
+        'cases',
+        'deaths',
+        pl.when(pl.col('cases') > 0)
+        .then((pl.col('recoveries') / pl.col('cases') * 100).round(0))
+        .otherwise(0)
+        .cast(pl.Int64)
+        .alias('recovery_rate_percent'),
+        pl.col('last_update').dt.strftime('%Y-%m-%d %H:%M:%S'),
+        'year'
+    )
+
+
+def _weekly_query(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """Weekly trend in dashboard row shape, ordered by ISO year-week."""
+    return (
+        lf.filter(pl.col('WeekStart').is_not_null())
+        .group_by('WeekStart')
+        .agg(
+            pl.len().alias('total_cases'),
+            pl.col('_is_confirmed').sum().alias('confirmed_cases'),
+            pl.col('_is_deceased').sum().alias('deaths'),
+            pl.col('_is_discharged').sum().alias('recoveries')
         )
+        # Sort on the date itself; the label is only rendered afterwards
+        .sort('WeekStart')
+        .select(
+            pl.col('WeekStart').dt.strftime('%G-W%V').alias('year_week'),  # e.g. 2025-W38
+            'total_cases',
+            'confirmed_cases',
+            'deaths',
+            'recoveries'
+        )
+    )
 
-        # --- Core Metrics ---
-        total_cases = len(df)
-        confirmed = df[df['Case_Status'] == 'Confirmed']
-        confirmed_cases = len(confirmed)
-
-        deaths = confirmed[confirmed['Outcome'] == 'Deceased'].shape[0]
-        recoveries = confirmed[confirmed['Outcome'] == 'Discharged'].shape[0]
-
-        fatality_rate = round(deaths / confirmed_cases * 100, 1) if confirmed_cases > 0 else 0.0
-        recovery_rate = round(recoveries / confirmed_cases * 100, 1) if confirmed_cases > 0 else 0.0
-
-        states_affected = df['State'].nunique()
-        lgas_affected = df['LGA'].nunique()
-
-        # --- Demographics Breakdown ---
-        def build_breakdown(series, total):
-            counts = series.value_counts()
-            return [
-                {
-                    "category": str(idx),
-                    "count": int(count),
-                    "percentage": round(count / total * 100, 1)
-                }
-                for idx, count in counts.items()
-            ]
-
-        age_breakdown = build_breakdown(df['AgeGroup'], total_cases)
-        gender_breakdown = build_breakdown(df['Gender'], total_cases)
-
-        # --- LGA Breakdown (with Year) ---
-        lga_agg = df.groupby(['LGA', 'State'], dropna=False).agg(
-            cases=('Patient_ID', 'count'),
-            deaths=('Outcome', lambda x: (x == 'Deceased').sum()),
-            recoveries=('Outcome', lambda x: (x == 'Discharged').sum()),
-            last_update=('Last_Update', 'max'),
-            year=('Year', 'max')
-        ).reset_index()
-
-        lga_summary = []
-        for _, row in lga_agg.iterrows():
-            cases = row['cases']
-            recovery_pct = round(row['recoveries'] / cases * 100) if cases > 0 else 0
-            lga_summary.append({
-                "lga": str(row['LGA']) if pd.notna(row['LGA']) else "Unknown",
-                "state": str(row['State']) if pd.notna(row['State']) else "Unknown",
-                "cases": int(cases),
-                "deaths": int(row['deaths']),
-                "recovery_rate_percent": int(recovery_pct),
-                "last_update": str(row['last_update']) if pd.notna(row['last_update']) else None,
-                "year": int(row['year']) if pd.notna(row['year']) else None
-            })
-
-        # --- WEEKLY TREND AGGREGATION ---
-        weekly_trend = df.groupby('YearWeek').agg(
-            total_cases=('Patient_ID', 'count'),
-            confirmed_cases=('Case_Status', lambda x: (x == 'Confirmed').sum()),
-            deaths=('Outcome', lambda x: (x == 'Deceased').sum()),
-            recoveries=('Outcome', lambda x: (x == 'Discharged').sum())
-        ).reset_index()
-
-        weekly_trend = weekly_trend.sort_values('YearWeek').reset_index(drop=True)
-
-        weekly_summary = []
-        for _, row in weekly_trend.iterrows():
-            weekly_summary.append({
-                "year_week": row['YearWeek'],
-                "total_cases": int(row['total_cases']),
-                "confirmed_cases": int(row['confirmed_cases']),
-                "deaths": int(row['deaths']),
-                "recoveries": int(row['recoveries'])
-            })
 
-        return {
-            "metadata": {
-                "generated_at": datetime.utcnow().isoformat() + "Z",
-                "data_file": DATA_FILE,
-                "total_records": total_cases
-            },
-            "kpi": {
-                "confirmed_cases": confirmed_cases,
-                "recoveries": recoveries,
-                "deaths": deaths,
-                "fatality_rate_percent": fatality_rate,
-                "recovery_rate_percent": recovery_rate,
-                "states_affected": states_affected,
-                "lgas_affected": lgas_affected
-            },
-            "demographics": {
-                "age_groups": age_breakdown,
-                "gender": gender_breakdown
-            },
-            "lga_breakdown": lga_summary,
-            "weekly_trend": weekly_summary
-        }
+@lru_cache(maxsize=1)
+def _build_summary(generation: int) -> dict:
+    """
+    Aggregate the cached dataset into the dashboard summary.
+    Keyed on DF_GENERATION, so the work only reruns after a refresh.
+    """
+    lf = DF_CACHE
+
+    # Collected together so Polars optimizes the queries as one plan,
+    # sharing scans of the cached frame and running them in parallel
+    kpi, states, lgas, age_counts, gender_counts, lga_agg, weekly_trend = pl.collect_all([
+        _kpi_query(lf),
+        _distinct_query(lf, 'State'),
+        _distinct_query(lf, 'LGA'),
+        _breakdown_query(lf, 'AgeGroup'),
+        _breakdown_query(lf, 'Gender'),
+        _lga_query(lf),
+        _weekly_query(lf)
+    ], streaming=DF_STREAMING)
+
+    # --- Core Metrics ---
+    kpi = kpi.row(0, named=True)
+    total_cases = kpi['total_records']
+    confirmed_cases = kpi['confirmed_cases']
+    deaths = kpi['deaths']
+    recoveries = kpi['recoveries']
+
+    fatality_rate = round(deaths / confirmed_cases * 100, 1) if confirmed_cases > 0 else 0.0
+    recovery_rate = round(recoveries / confirmed_cases * 100, 1) if confirmed_cases > 0 else 0.0
+
+    states_affected = states.item()
+    lgas_affected = lgas.item()
+
+    # --- Demographics Breakdown ---
+    def build_breakdown(counts, total):
+        return [
+            {
+                "category": category,
+                "count": count,
+                "percentage": round(count / total * 100, 1)
+            }
+            for category, count in counts.iter_rows()
+        ]
+
+    age_breakdown = build_breakdown(age_counts, total_cases)
+    gender_breakdown = build_breakdown(gender_counts, total_cases)
+
+    lga_summary = lga_agg.to_dicts()
+    weekly_summary = weekly_trend.to_dicts()
+
+    summary = {
+        "metadata": {
+            "generated_at": datetime.utcnow(),
+            "data_file": DATA_FILE,
+            "total_records": total_cases
+        },
+        "kpi": {
+            "confirmed_cases": confirmed_cases,
+            "recoveries": recoveries,
+            "deaths": deaths,
+            "fatality_rate_percent": fatality_rate,
+            "recovery_rate_percent": recovery_rate,
+            "states_affected": states_affected,
+            "lgas_affected": lgas_affected
+        },
+        "demographics": {
+            "age_groups": age_breakdown,
+            "gender": gender_breakdown
+        },
+        "lga_breakdown": lga_summary,
+        "weekly_trend": weekly_summary
+    }
+
+    return summary
 
+
+@lru_cache(maxsize=1)
+def _compute_summary(generation: int) -> bytes:
+    """Dashboard summary serialized to JSON, cached alongside _build_summary."""
+    return orjson.dumps(
+        _build_summary(generation),
+        option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+    )
+
+
+@app.get("/summary")
+def get_summary():
+    """
+    Returns aggregated outbreak summary in dashboard-ready JSON format.
+    Includes KPIs, demographics, LGA breakdown, and WEEKLY trends.
+    """
+    try:
+        if DF_CACHE is None:
+            refresh_data_cache()
+        content = _compute_summary(DF_GENERATION)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Aggregation failed: {str(e)}")
+
+    return Response(content=content, media_type="application/json")
@@ -0,0 +1,26 @@
+"""
+One-time conversion of the CSV dataset to Parquet.
+
+Usage:
+    python to_parquet.py [source.csv] [dataset.parquet]
+
+Then start the API with DATA_FILE=dataset.parquet. The file also stores the
+derived summary columns (Year, WeekStart, AgeGroup, ...), so loading it
+needs no derivation work.
+"""
+import sys
+
+from main import DATA_FILE, load_and_validate_data, write_parquet
+
+
+def main():
+    source = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    target = sys.argv[2] if len(sys.argv) > 2 else "dataset.parquet"
+
+    df = load_and_validate_data(source)
+    write_parquet(df, target)
+    print(f"Wrote {len(df)} records from {source} to {target}")
+
+
+if __name__ == "__main__":
+    main()